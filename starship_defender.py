@@ -7,6 +7,7 @@ import random
 import os
 import sys
 import math
+import argparse
 from enum import Enum
 
 # Initialize pygame
@@ -26,11 +27,71 @@ GREEN = (0, 255, 0)
 BLUE = (0, 0, 255)
 YELLOW = (255, 255, 0)
 
+# Display options
+def parse_resolution(value):
+    """Parse a WIDTHxHEIGHT resolution string"""
+    try:
+        width, height = (int(part) for part in value.lower().split('x'))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid resolution: {value!r} (expected WIDTHxHEIGHT)")
+    if width <= 0 or height <= 0:
+        raise argparse.ArgumentTypeError(f"invalid resolution: {value!r}")
+    return width, height
+
+parser = argparse.ArgumentParser(description="Starship Defender")
+parser.add_argument('--resolution', type=parse_resolution, default=None,
+                    help="display resolution as WIDTHxHEIGHT (default: 800x600, or the desktop size in fullscreen)")
+parser.add_argument('--fullscreen', action='store_true', help="run in fullscreen mode")
+parser.add_argument('--native-art', action='store_true',
+                    help="redraw sprites and HUD at the display scale instead of scaling the finished frame")
+args, _ = parser.parse_known_args()
+
+if args.resolution:
+    display_size = args.resolution
+elif args.fullscreen:
+    display_info = pygame.display.Info()
+    display_size = (display_info.current_w, display_info.current_h)
+else:
+    display_size = (SCREEN_WIDTH, SCREEN_HEIGHT)
+
 # Create game window
-screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+display = pygame.display.set_mode(display_size, pygame.FULLSCREEN if args.fullscreen else 0)
 pygame.display.set_caption("Starship Defender")
 clock = pygame.time.Clock()
 
+# The game always runs in logical SCREEN_WIDTH x SCREEN_HEIGHT coordinates.
+# The logical area is fitted into the display, keeping its aspect ratio.
+display_scale = min(display_size[0] / SCREEN_WIDTH, display_size[1] / SCREEN_HEIGHT)
+viewport = pygame.Rect(0, 0, round(SCREEN_WIDTH * display_scale), round(SCREEN_HEIGHT * display_scale))
+viewport.center = (display_size[0] // 2, display_size[1] // 2)
+display.fill(BLACK)
+
+if viewport.size == (SCREEN_WIDTH, SCREEN_HEIGHT):
+    # Display matches the logical size, draw straight to it
+    render_scale = 1
+    screen = display.subsurface(viewport)
+    viewport_surface = None
+elif args.native_art:
+    # Draw straight into the viewport with art generated at the display scale
+    render_scale = display_scale
+    screen = display.subsurface(viewport)
+    viewport_surface = None
+else:
+    # Draw to a logical-size offscreen surface and scale it once per frame
+    render_scale = 1
+    screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+    viewport_surface = display.subsurface(viewport)
+
+def scaled(value):
+    """Convert a logical length or coordinate to render surface pixels"""
+    return int(round(value * render_scale))
+
+def present():
+    """Show the rendered frame on the display"""
+    if viewport_surface is not None:
+        pygame.transform.scale(screen, viewport.size, viewport_surface)
+    pygame.display.flip()
+
 # Create assets directory if it doesn't exist
 if not os.path.exists('assets'):
     os.makedirs('assets')
@@ -38,46 +99,90 @@ if not os.path.exists('assets'):
     os.makedirs('assets/images')
 
 # Load images (using simple shapes for now)
-def draw_player_ship(surface, color=BLUE, width=30, height=40):
+def draw_player_ship(surface, color=BLUE, width=30, height=40, scale=1):
     """Draw a simple player ship"""
+    width, height = round(width * scale), round(height * scale)
+    outline = max(1, round(scale))
     ship = pygame.Surface((width, height), pygame.SRCALPHA)
     pygame.draw.polygon(ship, color, [(width//2, 0), (0, height), (width, height)])
-    pygame.draw.polygon(ship, WHITE, [(width//2, 0), (0, height), (width, height)], 1)
+    pygame.draw.polygon(ship, WHITE, [(width//2, 0), (0, height), (width, height)], outline)
     return ship
 
-def draw_enemy_ship1(surface, color=RED, width=30, height=30):
+def draw_enemy_ship1(surface, color=RED, width=30, height=30, scale=1):
     """Draw a simple enemy ship type 1"""
+    width, height = round(width * scale), round(height * scale)
+    outline = max(1, round(scale))
     ship = pygame.Surface((width, height), pygame.SRCALPHA)
     pygame.draw.polygon(ship, color, [(0, 0), (width, 0), (width//2, height)])
-    pygame.draw.polygon(ship, WHITE, [(0, 0), (width, 0), (width//2, height)], 1)
+    pygame.draw.polygon(ship, WHITE, [(0, 0), (width, 0), (width//2, height)], outline)
     return ship
 
-def draw_enemy_ship2(surface, color=GREEN, width=40, height=20):
+def draw_enemy_ship2(surface, color=GREEN, width=40, height=20, scale=1):
     """Draw a simple enemy ship type 2"""
+    width, height = round(width * scale), round(height * scale)
+    outline = max(1, round(scale))
     ship = pygame.Surface((width, height), pygame.SRCALPHA)
     pygame.draw.ellipse(ship, color, (0, 0, width, height))
-    pygame.draw.ellipse(ship, WHITE, (0, 0, width, height), 1)
+    pygame.draw.ellipse(ship, WHITE, (0, 0, width, height), outline)
     return ship
 
-def draw_bullet(surface, color=YELLOW, width=4, height=10):
+def draw_bullet(surface, color=YELLOW, width=4, height=10, scale=1):
     """Draw a simple bullet"""
+    width, height = round(width * scale), round(height * scale)
     bullet = pygame.Surface((width, height), pygame.SRCALPHA)
     pygame.draw.rect(bullet, color, (0, 0, width, height))
     return bullet
 
-def draw_explosion(surface, radius, color=YELLOW):
+def draw_explosion(surface, radius, color=YELLOW, scale=1):
     """Draw a simple explosion"""
+    radius = radius * scale
     explosion = pygame.Surface((radius*2, radius*2), pygame.SRCALPHA)
     pygame.draw.circle(explosion, color, (radius, radius), radius)
     return explosion
 
+def draw_powerup(surface, color, size=20, scale=1):
+    """Draw a simple power-up"""
+    size = round(size * scale)
+    outline = max(1, round(scale))
+    powerup = pygame.Surface((size, size), pygame.SRCALPHA)
+    pygame.draw.circle(powerup, color, (size//2, size//2), size//2)
+    pygame.draw.circle(powerup, WHITE, (size//2, size//2), size//2, outline)
+    return powerup
+
+# Asset builders, keyed by asset name. Explosion frames use ('explosion', radius).
+asset_builders = {
+    'player': lambda scale: draw_player_ship(screen, scale=scale),
+    'life': lambda scale: draw_player_ship(screen, width=25, height=25, scale=scale),
+    'enemy1': lambda scale: draw_enemy_ship1(screen, scale=scale),
+    'enemy2': lambda scale: draw_enemy_ship2(screen, scale=scale),
+    'bullet': lambda scale: draw_bullet(screen, scale=scale),
+    'player_bullet': lambda scale: draw_bullet(screen, BLUE, scale=scale),
+    'enemy_bullet': lambda scale: draw_bullet(screen, RED, scale=scale),
+    'powerup_shield': lambda scale: draw_powerup(screen, BLUE, scale=scale),
+    'powerup_double_shot': lambda scale: draw_powerup(screen, GREEN, scale=scale),
+    'powerup_rapid_fire': lambda scale: draw_powerup(screen, YELLOW, scale=scale),
+}
+
+# Generated sprites, keyed by (asset, scale)
+sprite_cache = {}
+
+def get_sprite(asset, scale=1):
+    """Return the sprite for an asset drawn at the given scale, generating it once"""
+    key = (asset, scale)
+    if key not in sprite_cache:
+        if isinstance(asset, tuple) and asset[0] == 'explosion':
+            sprite_cache[key] = draw_explosion(screen, asset[1], scale=scale)
+        else:
+            sprite_cache[key] = asset_builders[asset](scale)
+    return sprite_cache[key]
+
 # Load game assets
-player_img = draw_player_ship(screen)
-enemy_img1 = draw_enemy_ship1(screen)
-enemy_img2 = draw_enemy_ship2(screen)
-bullet_img = draw_bullet(screen)
-player_bullet_img = draw_bullet(screen, BLUE)
-enemy_bullet_img = draw_bullet(screen, RED)
+player_img = get_sprite('player')
+enemy_img1 = get_sprite('enemy1')
+enemy_img2 = get_sprite('enemy2')
+bullet_img = get_sprite('bullet')
+player_bullet_img = get_sprite('player_bullet')
+enemy_bullet_img = get_sprite('enemy_bullet')
 
 # Create stars for background
 stars = []
@@ -98,6 +203,7 @@ class PowerUpType(Enum):
 class Player(pygame.sprite.Sprite):
     def __init__(self):
         pygame.sprite.Sprite.__init__(self)
+        self.asset = 'player'
         self.image = player_img
         self.rect = self.image.get_rect()
         self.rect.centerx = SCREEN_WIDTH // 2
@@ -163,14 +269,14 @@ class Player(pygame.sprite.Sprite):
         if now - self.last_shot > self.shoot_delay and not self.hidden:
             self.last_shot = now
             if self.double_shot:
-                bullet1 = Bullet(self.rect.left + 5, self.rect.top, -10, player_bullet_img, True)
-                bullet2 = Bullet(self.rect.right - 5, self.rect.top, -10, player_bullet_img, True)
+                bullet1 = Bullet(self.rect.left + 5, self.rect.top, -10, 'player_bullet', True)
+                bullet2 = Bullet(self.rect.right - 5, self.rect.top, -10, 'player_bullet', True)
                 all_sprites.add(bullet1, bullet2)
                 bullets.add(bullet1, bullet2)
                 if shoot_sound:
                     shoot_sound.play()
             else:
-                bullet = Bullet(self.rect.centerx, self.rect.top, -10, player_bullet_img, True)
+                bullet = Bullet(self.rect.centerx, self.rect.top, -10, 'player_bullet', True)
                 all_sprites.add(bullet)
                 bullets.add(bullet)
                 if shoot_sound:
@@ -206,6 +312,7 @@ class Enemy(pygame.sprite.Sprite):
         self.enemy_type = enemy_type
         
         if enemy_type == 1:
+            self.asset = 'enemy1'
             self.image = enemy_img1
             self.speed_y = random.randrange(1, 3)
             self.speed_x = random.randrange(-1, 2)
@@ -213,6 +320,7 @@ class Enemy(pygame.sprite.Sprite):
             self.health = 1
             self.score_value = 10
         else:  # enemy_type == 2
+            self.asset = 'enemy2'
             self.image = enemy_img2
             self.speed_y = random.randrange(1, 2)
             self.speed_x = random.randrange(-2, 3)
@@ -248,14 +356,15 @@ class Enemy(pygame.sprite.Sprite):
         now = pygame.time.get_ticks()
         if now - self.last_shot > self.shoot_delay:
             self.last_shot = now
-            bullet = Bullet(self.rect.centerx, self.rect.bottom, 5, enemy_bullet_img, False)
+            bullet = Bullet(self.rect.centerx, self.rect.bottom, 5, 'enemy_bullet', False)
             all_sprites.add(bullet)
             enemy_bullets.add(bullet)
 
 class Bullet(pygame.sprite.Sprite):
-    def __init__(self, x, y, speed, img, is_player_bullet):
+    def __init__(self, x, y, speed, asset, is_player_bullet):
         pygame.sprite.Sprite.__init__(self)
-        self.image = img
+        self.asset = asset
+        self.image = get_sprite(asset)
         self.rect = self.image.get_rect()
         self.rect.centerx = x
         self.rect.bottom = y
@@ -277,7 +386,8 @@ class Explosion(pygame.sprite.Sprite):
         pygame.sprite.Sprite.__init__(self)
         self.size = size
         self.frame = 0
-        self.image = draw_explosion(screen, self.size * (self.frame + 1))
+        self.asset = ('explosion', self.size * (self.frame + 1))
+        self.image = get_sprite(self.asset)
         self.rect = self.image.get_rect()
         self.rect.center = center
         self.frame_rate = 50
@@ -289,7 +399,8 @@ class Explosion(pygame.sprite.Sprite):
             self.last_update = now
             self.frame += 1
             if self.frame < 8:  # 8 frames of explosion
-                self.image = draw_explosion(screen, self.size * (8 - self.frame) / 2)
+                self.asset = ('explosion', self.size * (8 - self.frame) / 2)
+                self.image = get_sprite(self.asset)
                 self.rect = self.image.get_rect()
                 self.rect.center = self.rect.center
             else:
@@ -300,19 +411,14 @@ class PowerUp(pygame.sprite.Sprite):
         pygame.sprite.Sprite.__init__(self)
         self.type = random.choice(list(PowerUpType))
         
-        # Create a simple colored circle for the power-up
-        size = 20
-        self.image = pygame.Surface((size, size), pygame.SRCALPHA)
-        
+        # Pick the colored circle for the power-up type
         if self.type == PowerUpType.SHIELD:
-            color = BLUE
+            self.asset = 'powerup_shield'
         elif self.type == PowerUpType.DOUBLE_SHOT:
-            color = GREEN
+            self.asset = 'powerup_double_shot'
         else:  # RAPID_FIRE
-            color = YELLOW
-            
-        pygame.draw.circle(self.image, color, (size//2, size//2), size//2)
-        pygame.draw.circle(self.image, WHITE, (size//2, size//2), size//2, 1)
+            self.asset = 'powerup_rapid_fire'
+        self.image = get_sprite(self.asset)
         
         self.rect = self.image.get_rect()
         self.rect.center = center
@@ -375,20 +481,42 @@ except:
     print("Warning: Sound files not found. Game will run without sound.")
 
 # Game functions
+font_name = pygame.font.match_font('arial')
+fonts = {}
+
+def get_font(size):
+    """Return the HUD font at the given pixel size, loading it once"""
+    if size not in fonts:
+        fonts[size] = pygame.font.Font(font_name, size)
+    return fonts[size]
+
 def draw_text(surf, text, size, x, y, color=WHITE):
     """Draw text on the screen"""
-    font = pygame.font.Font(pygame.font.match_font('arial'), size)
+    font = get_font(scaled(size))
     text_surface = font.render(text, True, color)
     text_rect = text_surface.get_rect()
-    text_rect.midtop = (x, y)
+    text_rect.midtop = (scaled(x), scaled(y))
     surf.blit(text_surface, text_rect)
 
+def draw_sprites(surf, sprites):
+    """Draw sprites at their logical positions using art at the render scale"""
+    if render_scale == 1:
+        sprites.draw(surf)
+        return
+    for sprite in sprites:
+        surf.blit(get_sprite(sprite.asset, render_scale), (scaled(sprite.rect.x), scaled(sprite.rect.y)))
+
+def draw_stars(surf):
+    """Draw the background stars"""
+    for star in stars:
+        pygame.draw.circle(surf, WHITE, (scaled(star[0]), scaled(star[1])), scaled(star[3]))
+
 def draw_lives(surf, x, y, lives, img):
     """Draw player lives on the screen"""
     for i in range(lives):
         img_rect = img.get_rect()
-        img_rect.x = x + 30 * i
-        img_rect.y = y
+        img_rect.x = scaled(x + 30 * i)
+        img_rect.y = scaled(y)
         surf.blit(img, img_rect)
 
 def draw_shield_bar(surf, x, y, pct):
@@ -398,18 +526,17 @@ def draw_shield_bar(surf, x, y, pct):
     BAR_LENGTH = 100
     BAR_HEIGHT = 10
     fill = (pct / 100) * BAR_LENGTH
-    outline_rect = pygame.Rect(x, y, BAR_LENGTH, BAR_HEIGHT)
-    fill_rect = pygame.Rect(x, y, fill, BAR_HEIGHT)
+    outline_rect = pygame.Rect(scaled(x), scaled(y), scaled(BAR_LENGTH), scaled(BAR_HEIGHT))
+    fill_rect = pygame.Rect(scaled(x), scaled(y), scaled(fill), scaled(BAR_HEIGHT))
     pygame.draw.rect(surf, BLUE, fill_rect)
-    pygame.draw.rect(surf, WHITE, outline_rect, 2)
+    pygame.draw.rect(surf, WHITE, outline_rect, scaled(2))
 
 def show_menu():
     """Display the main menu"""
     screen.fill(BLACK)
     
     # Draw stars
-    for star in stars:
-        pygame.draw.circle(screen, WHITE, (int(star[0]), int(star[1])), star[3])
+    draw_stars(screen)
     
     # Draw title
     draw_text(screen, "STARSHIP DEFENDER", 64, SCREEN_WIDTH // 2, SCREEN_HEIGHT // 4)
@@ -417,7 +544,7 @@ def show_menu():
     draw_text(screen, "Press ENTER to start", 18, SCREEN_WIDTH // 2, SCREEN_HEIGHT * 3/4)
     draw_text(screen, "Press Q to quit", 18, SCREEN_WIDTH // 2, SCREEN_HEIGHT * 3/4 + 30)
     
-    pygame.display.flip()
+    present()
     
     waiting = True
     while waiting:
@@ -439,15 +566,14 @@ def show_game_over():
     screen.fill(BLACK)
     
     # Draw stars
-    for star in stars:
-        pygame.draw.circle(screen, WHITE, (int(star[0]), int(star[1])), star[3])
+    draw_stars(screen)
     
     draw_text(screen, "GAME OVER", 64, SCREEN_WIDTH // 2, SCREEN_HEIGHT // 4)
     draw_text(screen, f"Final Score: {player.score}", 36, SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
     draw_text(screen, "Press ENTER to play again", 22, SCREEN_WIDTH // 2, SCREEN_HEIGHT * 3/4)
     draw_text(screen, "Press Q to quit", 22, SCREEN_WIDTH // 2, SCREEN_HEIGHT * 3/4 + 30)
     
-    pygame.display.flip()
+    present()
     
     waiting = True
     while waiting:
@@ -622,15 +748,14 @@ while running:
         screen.fill(BLACK)
         
         # Draw stars
-        for star in stars:
-            pygame.draw.circle(screen, WHITE, (int(star[0]), int(star[1])), star[3])
+        draw_stars(screen)
         
         # Draw all sprites
-        all_sprites.draw(screen)
+        draw_sprites(screen, all_sprites)
         
         # Draw UI
         draw_text(screen, str(player.score), 18, SCREEN_WIDTH // 2, 10)
-        draw_lives(screen, SCREEN_WIDTH - 100, 5, player.lives, pygame.transform.scale(player_img, (25, 25)))
+        draw_lives(screen, SCREEN_WIDTH - 100, 5, player.lives, get_sprite('life', render_scale))
         
         # Draw shield bar if player has shield
         if player.shield > 0:
@@ -647,6 +772,6 @@ while running:
         draw_text(screen, f"Level: {difficulty_level}", 18, 50, 10)
     
     # Flip the display
-    pygame.display.flip()
+    present()
 
 pygame.quit()